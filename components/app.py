@@ -4,7 +4,7 @@ Main app component that integrates all other components
 import os
 from PyQt5.QtWidgets import QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QAction
 from PyQt5.QtGui import QPixmap, QFont, QIcon
-from PyQt5.QtCore import Qt, QSize, QTimer
+from PyQt5.QtCore import Qt, QSize
 
 from components.gallery import GalleryComponent
 from components.gesture_recognizer import GestureRecognizer
@@ -74,10 +74,8 @@ class PhotoGalleryApp(QMainWindow):
         # Connect signals
         self.connect_signals()
         
-        # Start gesture recognition
-        self.gesture_timer = QTimer(self)
-        self.gesture_timer.timeout.connect(self.process_gestures)
-        self.gesture_timer.start(100)  # Process gestures every 100ms
+        # Start gesture recognition (capture and inference run on background threads)
+        self.gesture_recognizer.start()
         
         # Remove status bar completely
         self.statusBar().hide()
@@ -108,10 +106,11 @@ class PhotoGalleryApp(QMainWindow):
         
     def closeEvent(self, event):
         """Override close event to close all associated windows"""
-        # Forcefully terminate the gesture recognizer and its camera
-        self.gesture_timer.stop()
-        if hasattr(self.gesture_recognizer, 'cap') and self.gesture_recognizer.cap is not None:
-            self.gesture_recognizer.cap.release()
+        # Stop the gesture recognizer threads and release its camera
+        self.gesture_recognizer.release()
+        
+        # Drop the gallery's queued background decodes so exit doesn't wait for them
+        self.gallery.stop_prefetch()
         
         # Close debug window - make sure to use close() and also deleteLater()
         if self.debug_window:
@@ -168,10 +167,11 @@ class PhotoGalleryApp(QMainWindow):
         self.gesture_recognizer.decrease_signal.connect(self.decrease_size)
         self.gesture_recognizer.debug_frame_signal.connect(self.debug_window.update_frame)
         self.gesture_recognizer.debug_text_signal.connect(self.debug_window.update_debug_text)
-        self.gesture_recognizer.status_signal.connect(self.update_status)
         
-    def process_gestures(self):
-        self.gesture_recognizer.process_frame()
+        # Only collect debug text while the debug window is visible
+        self.debug_window.visibility_changed.connect(self.gesture_recognizer.set_debug_enabled)
+        self.gesture_recognizer.set_debug_enabled(self.debug_window.isVisible())
+        self.gesture_recognizer.status_signal.connect(self.update_status)
         
     def update_status(self, status_text):
         # Do not display gesture status texts in the status bar
@@ -3,13 +3,19 @@ Debug window component for displaying camera feed and gesture detection visualiz
 """
 from PyQt5.QtWidgets import QWidget, QLabel, QVBoxLayout, QHBoxLayout, QPushButton, QMainWindow, QTextEdit, QScrollArea
 from PyQt5.QtGui import QPixmap, QImage, QIcon, QFont
-from PyQt5.QtCore import Qt, pyqtSlot
+from PyQt5.QtCore import Qt, pyqtSignal, pyqtSlot
 
 class DebugWindow(QMainWindow):
+    # Emitted with True when the window is shown and False when it is hidden
+    visibility_changed = pyqtSignal(bool)
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle("Gesture Recognition Debug")
         
+        # Latest camera frame, kept so resizes rescale the original instead of a scaled copy
+        self.last_frame = None
+        
         # Set window size and position
         self.setMinimumSize(640, 720)
         
@@ -53,16 +59,19 @@ class DebugWindow(QMainWindow):
     
     @pyqtSlot(QImage)
     def update_frame(self, frame):
-        """Update the debug window with a new frame"""
+        """Update the debug window with a new frame (a detached copy owned by this window)"""
         if frame.isNull():
             return
-            
-        # Resize the frame to fit the label while maintaining aspect ratio
-        pixmap = QPixmap.fromImage(frame)
-        pixmap = pixmap.scaled(self.video_label.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation)
         
-        # Set the pixmap to the label
-        self.video_label.setPixmap(pixmap)
+        self.last_frame = frame
+        self.show_frame()
+    
+    def show_frame(self):
+        """Scale the latest frame to fit the label and convert it to a pixmap in one pass"""
+        # Scaling the QImage first and converting once avoids the QImage/QPixmap round trip
+        # that QPixmap.scaled does internally
+        frame = self.last_frame.scaled(self.video_label.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        self.video_label.setPixmap(QPixmap.fromImage(frame))
         
     @pyqtSlot(str)
     def update_debug_text(self, text):
@@ -71,12 +80,20 @@ class DebugWindow(QMainWindow):
         # Automatically scroll to the bottom to show latest debug info
         self.debug_text.verticalScrollBar().setValue(self.debug_text.verticalScrollBar().maximum())
     
+    def showEvent(self, event):
+        """Notify listeners that the debug window became visible"""
+        super().showEvent(event)
+        self.visibility_changed.emit(True)
+    
+    def hideEvent(self, event):
+        """Notify listeners that the debug window was hidden"""
+        super().hideEvent(event)
+        self.visibility_changed.emit(False)
+    
     def resizeEvent(self, event):
         """Handle resize events to update the frame display"""
         super().resizeEvent(event)
         
-        # If we have a pixmap, resize it to fit the new size
-        if self.video_label.pixmap() and not self.video_label.pixmap().isNull():
-            pixmap = self.video_label.pixmap().scaled(
-                self.video_label.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation)
-            self.video_label.setPixmap(pixmap)
+        # If we have a frame, rescale it from the original to fit the new size
+        if self.last_frame is not None:
+            self.show_frame()
@@ -2,20 +2,52 @@
 Gallery component for displaying and navigating images
 """
 import os
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from PyQt5.QtWidgets import QWidget, QLabel, QVBoxLayout, QHBoxLayout, QPushButton
-from PyQt5.QtGui import QPixmap, QImage, QTransform
+from PyQt5.QtGui import QPixmap, QImage, QImageReader, QTransform
 from PyQt5.QtCore import Qt, pyqtSignal, QSize
 
+def read_scaled_image(image_path, size):
+    """Decode an image scaled to fit the given size, safe to call off the GUI thread"""
+    # JPEGs are downscaled while decoding, so the full-resolution image is never held
+    reader = QImageReader(image_path)
+    source_size = reader.size()
+    if source_size.isValid():
+        reader.setScaledSize(source_size.scaled(size, Qt.KeepAspectRatio))
+        return reader.read()
+    image = reader.read()
+    if image.isNull():
+        return image
+    return image.scaled(size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+
 class GalleryComponent(QWidget):
+    image_prefetched = pyqtSignal(str, int, int, QImage)  # path, label width, label height, image
+    
     def __init__(self, images_dir):
         super().__init__()
         self.images_dir = images_dir
         self.image_paths = []
         self.current_index = 0
         self.zoom_factor = 1.0
+        self.original_zoom_factor = 1.0  # Zoom factor to restore when leaving fullscreen
         self.rotation = 0
         self.fullscreen_mode = False  # Track if we're in fullscreen mode
         
+        # Recently shown pixmaps fitted to the label, keyed by path and label size (least recently
+        # used first), so revisited images don't reload from disk, and the key of what is shown,
+        # to skip redundant redraws
+        self.pixmap_cache = OrderedDict()
+        self.pixmap_cache_size = 8
+        self.displayed_key = None
+        
+        # Neighbouring images are decoded on a background thread and cached once they arrive.
+        # Only the current label size is prefetched: jobs for an outdated size are dropped.
+        self.prefetch_executor = ThreadPoolExecutor(max_workers=1)
+        self.pending_prefetches = {}  # Cache key -> future of the queued decode
+        self.prefetch_size = None  # (width, height) of the label being prefetched for
+        self.image_prefetched.connect(self.store_prefetched)
+        
         # Load image paths
         self.load_images()
         
@@ -130,15 +162,14 @@ class GalleryComponent(QWidget):
             self.display_image()
     
     def load_images(self):
-        # Get all image files from the directory
-        valid_extensions = ['.jpg', '.jpeg', '.png', '.gif', '.bmp', '.JPG']
+        # Get all image files from the directory (extensions matched case-insensitively)
+        valid_extensions = ('.jpg', '.jpeg', '.png', '.gif', '.bmp')
         
-        if os.path.exists(self.images_dir) and os.path.isdir(self.images_dir):
-            for file_name in os.listdir(self.images_dir):
-                ext = os.path.splitext(file_name)[1]
-                if ext in valid_extensions:
-                    full_path = os.path.join(self.images_dir, file_name)
-                    self.image_paths.append(full_path)
+        if os.path.isdir(self.images_dir):
+            # scandir entries carry the file type and full path, avoiding a stat and join per file
+            with os.scandir(self.images_dir) as entries:
+                self.image_paths = [entry.path for entry in entries
+                                    if entry.is_file() and entry.name.lower().endswith(valid_extensions)]
         
         # Sort image paths
         self.image_paths.sort()
@@ -150,39 +181,106 @@ class GalleryComponent(QWidget):
         # Get current image path
         image_path = self.image_paths[self.current_index]
         
+        # Nothing to do if the same image is already shown with the same rotation and size
+        label_size = self.image_label.size()
+        key = (image_path, self.rotation, label_size.width(), label_size.height())
+        if key == self.displayed_key:
+            return
+        self.displayed_key = key
+        
         # Update image counter in the format "1/8"
         self.image_counter.setText(f"{self.current_index + 1}/{len(self.image_paths)}")
         
-        # Load image
-        pixmap = QPixmap(image_path)
-        
-        # Apply transformations
-        if self.zoom_factor != 1.0 or self.rotation != 0:
-            # Convert to QImage for transformation
-            image = pixmap.toImage()
-            
-            # Apply rotation
-            if self.rotation != 0:
+        # Rotation is rare: rotate and fit the full image to the label in a single smooth
+        # resample. Otherwise show the image decoded to fit the label, from the cache when possible.
+        # The zoom factor needs no resample of its own: fullscreen enlarges the label itself.
+        if self.rotation != 0:
+            pixmap = QPixmap(image_path)
+            if not pixmap.isNull():
                 transform = QTransform().rotate(self.rotation)
-                image = image.transformed(transform)
-            
-            # Apply zoom
-            if self.zoom_factor != 1.0:
-                new_width = int(image.width() * self.zoom_factor)
-                new_height = int(image.height() * self.zoom_factor)
-                image = image.scaled(new_width, new_height, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-            
-            # Convert back to pixmap
-            pixmap = QPixmap.fromImage(image)
-        
-        # Resize to fit the label while maintaining aspect ratio
-        pixmap = pixmap.scaled(self.image_label.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation)
+                rotated_size = transform.mapRect(pixmap.rect()).size()
+                fitted_size = rotated_size.scaled(label_size, Qt.KeepAspectRatio)
+                scale = fitted_size.width() / rotated_size.width()
+                pixmap = pixmap.transformed(transform.scale(scale, scale), Qt.SmoothTransformation)
+        else:
+            pixmap = self.load_pixmap(image_path, label_size)
         
         # Set pixmap to label
         self.image_label.setPixmap(pixmap)
         
         # Update window title with image name
         self.window().setWindowTitle("Photo Gallery")
+        
+        # Decode the neighbouring images in the background, so the next navigation gesture
+        # finds them in the cache
+        self.prefetch_neighbors(label_size)
+    
+    def load_pixmap(self, image_path, label_size):
+        # Return the image fitted to the label size, decoding and caching it on a miss
+        key = (image_path, label_size.width(), label_size.height())
+        pixmap = self.pixmap_cache.get(key)
+        if pixmap is None:
+            pixmap = QPixmap.fromImage(read_scaled_image(image_path, label_size))
+            self.cache_pixmap(key, pixmap)
+        else:
+            self.pixmap_cache.move_to_end(key)
+        return pixmap
+    
+    def cache_pixmap(self, key, pixmap):
+        # Add a fitted pixmap to the cache, dropping the least recently used one when full
+        self.pixmap_cache[key] = pixmap
+        self.pixmap_cache.move_to_end(key)
+        if len(self.pixmap_cache) > self.pixmap_cache_size:
+            self.pixmap_cache.popitem(last=False)
+    
+    def prefetch_neighbors(self, label_size):
+        # Decode the next and previous images on the prefetch thread, unless they are
+        # already cached or being decoded
+        if not self.image_paths or self.prefetch_executor is None:
+            return
+        size = (label_size.width(), label_size.height())
+        if size != self.prefetch_size:
+            # The label was resized: cancel the queued decodes for the old size
+            self.prefetch_size = size
+            for key, future in list(self.pending_prefetches.items()):
+                if key[1:] != size:
+                    future.cancel()
+                    del self.pending_prefetches[key]
+        for offset in (1, -1):
+            image_path = self.image_paths[(self.current_index + offset) % len(self.image_paths)]
+            key = (image_path,) + size
+            if key not in self.pixmap_cache and key not in self.pending_prefetches:
+                self.pending_prefetches[key] = self.prefetch_executor.submit(
+                    self.prefetch_image, image_path, QSize(label_size))
+    
+    def prefetch_image(self, image_path, label_size):
+        # Runs on the prefetch thread: QPixmaps may only be created on the GUI thread,
+        # so the decoded QImage is handed back through a queued signal. A decode that
+        # started before a resize or before the gallery stopped is skipped.
+        size = (label_size.width(), label_size.height())
+        if size != self.prefetch_size:
+            return
+        image = read_scaled_image(image_path, label_size)
+        if size == self.prefetch_size:
+            self.image_prefetched.emit(image_path, size[0], size[1], image)
+    
+    def store_prefetched(self, image_path, width, height, image):
+        # Cache a prefetched image as a pixmap, back on the GUI thread, unless the
+        # label has been resized since it was requested
+        key = (image_path, width, height)
+        self.pending_prefetches.pop(key, None)
+        if (width, height) == self.prefetch_size and key not in self.pixmap_cache:
+            self.cache_pixmap(key, QPixmap.fromImage(image))
+    
+    def stop_prefetch(self):
+        # Cancel the queued decodes without waiting for them, and keep a running one from
+        # reporting back, before the gallery is torn down
+        if self.prefetch_executor is None:
+            return
+        self.prefetch_size = None
+        self.pending_prefetches.clear()
+        self.prefetch_executor.shutdown(wait=False, cancel_futures=True)
+        self.prefetch_executor = None
     
     def add_to_history(self):
         # Save current state to history
@@ -281,10 +379,7 @@ class GalleryComponent(QWidget):
         self.parentWidget().parentWidget().showNormal()
         
         # Restore original zoom factor
-        if hasattr(self, 'original_zoom_factor'):
-            self.zoom_factor = self.original_zoom_factor
-        else:
-            self.zoom_factor = 1.0
+        self.zoom_factor = self.original_zoom_factor
         
         # Show navigation buttons but hide the decrease button
         self.prev_button.setVisible(True)
@@ -1,13 +1,27 @@
 """
 Gesture recognizer component for detecting and interpreting hand gestures
 """
+import math
+import queue
+import sys
+import threading
 import cv2
 import numpy as np
 import time
 import mediapipe as mp
-from PyQt5.QtCore import QObject, pyqtSignal
+from PyQt5.QtCore import QObject, pyqtSignal, pyqtSlot
 from PyQt5.QtGui import QImage
 
+from components.video_pipeline import CaptureThread, InferenceThread
+
+# Hand landmark indices of the five fingertips (thumb to pinky) and of the joint below each
+# tip (thumb IP, finger PIPs), used to check all fingers at once
+FINGERTIP_INDICES = np.array([4, 8, 12, 16, 20])
+FINGER_JOINT_INDICES = np.array([3, 6, 10, 14, 18])
+
+# States of the help gesture (double tap) state machine
+HELP_WAITING, HELP_FIRST_TAP, HELP_BETWEEN_TAPS, HELP_SECOND_TAP = range(4)
+
 class GestureRecognizer(QObject):
     """
     Gesture recognizer class using MediaPipe for hand tracking and gesture detection
@@ -25,180 +39,172 @@ class GestureRecognizer(QObject):
     def __init__(self):
         super().__init__()
         
-        # Initialize MediaPipe solutions
-        self.mp_drawing = mp.solutions.drawing_utils
-        self.mp_drawing_styles = mp.solutions.drawing_styles
-        self.mp_hands = mp.solutions.hands
+        # MediaPipe pose landmark definitions, with the indices used every frame cached as ints
         self.mp_pose = mp.solutions.pose
+        self.temple_index = int(self.mp_pose.PoseLandmark.LEFT_EYE_OUTER)  # Temple area in mirrored view
+        self.left_hip_index = int(self.mp_pose.PoseLandmark.LEFT_HIP)
+        self.right_hip_index = int(self.mp_pose.PoseLandmark.RIGHT_HIP)
+        
+        # Camera settings: MediaPipe works well at low resolution, and a small driver
+        # buffer keeps frames from queuing up behind the processing loop
+        self.capture_width = 320
+        self.capture_height = 240
+        self.capture_fps = 30
+        
+        # Run Hands and Pose concurrently on frames where both are needed (uses a second core)
+        self.parallel_inference = True
         
         # Initialize webcam
-        self.cap = cv2.VideoCapture(0)
-        
-        # Initialize MediaPipe Hands and Pose detection
-        self.hands = self.mp_hands.Hands(
-            static_image_mode=False,
-            max_num_hands=2,
-            min_detection_confidence=0.7,
-            min_tracking_confidence=0.5
-        )
-        
-        self.pose = self.mp_pose.Pose(
-            static_image_mode=False,
-            model_complexity=1,
-            enable_segmentation=False,
-            min_detection_confidence=0.7,
-            min_tracking_confidence=0.5
-        )
+        self.cap = self.open_camera()
+        
+        # Capture and inference run on their own threads, handing over only the latest frame.
+        # The inference thread sets frame_request when it is ready for the next frame.
+        self.frame_queue = queue.Queue(maxsize=1)
+        self.frame_request = threading.Event()
+        self.capture_thread = CaptureThread(self.cap, self.frame_queue, self.frame_request)
+        self.inference_thread = InferenceThread(self.frame_queue, self.frame_request, self.parallel_inference)
+        self.inference_thread.results_signal.connect(self.process_results)
+        self.inference_thread.debug_frame_signal.connect(self.debug_frame_signal)
         
         # Variable to store current gesture text (for persistent display)
         self.current_gesture_text = ""
         
-        # Initialize variables for gesture detection
-        self.last_gesture_time = time.time()
+        # Initialize variables for gesture detection. Times are integer nanoseconds from
+        # time.monotonic_ns(), read once per frame into frame_time.
+        self.frame_time = time.monotonic_ns()
+        self.last_gesture_time = self.frame_time
         self.gesture_cooldown = 1.0  # Cooldown period between gestures in seconds
+        self.gesture_cooldown_ns = int(self.gesture_cooldown * 1e9)
         
         # Frame dimensions
         self.frame_width = int(self.cap.get(cv2.CAP_PROP_FRAME_WIDTH))
         self.frame_height = int(self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
         
-        # Debug information
-        self.debug_info = ""
+        # Debug information, only collected while the debug window is shown and
+        # throttled to a rate the debug text area can usefully display
+        self.debug_enabled = False
+        self.collect_debug = False  # Whether the current frame's debug text is collected
+        self.debug_lines = []
+        self.debug_text_interval_ns = int(0.2 * 1e9)  # Between debug text updates (5 Hz)
+        self.last_debug_text_time = 0
+        
+        # Landmark arrays filled in place every frame instead of being reallocated:
+        # both hands, the pose targets (temple, left hip, right hip) and their offsets
+        self.left_hand_points = np.empty((21, 3), dtype=np.float32)
+        self.right_hand_points = np.empty((21, 3), dtype=np.float32)
+        self.pose_target_points = np.empty((3, 3), dtype=np.float32)
+        self.pose_target_diffs = np.empty((3, 3), dtype=np.float32)
         
         # Touch detection thresholds
         self.touch_threshold = 0.08  # General threshold for detecting touch
+        self.touch_threshold_sq = self.touch_threshold ** 2  # Compared against squared distances
         self.finger_touch_threshold = 0.07  # Increased threshold for better finger-to-finger detection
+        self.finger_touch_threshold_sq = self.finger_touch_threshold ** 2
+        
+        # Temple threshold for the help gesture (more sensitive than general touch). The temple
+        # distance is scaled by 1.5, which is folded into the squared thresholds instead.
+        self.temple_threshold = 0.1
+        self.temple_touch_threshold_sq = (self.temple_threshold / 1.5) ** 2
+        self.temple_release_threshold_sq = self.temple_threshold ** 2  # Finger moved away (1.5x threshold)
         
         # State variables for double tap detection (for help gesture)
-        self.help_state = "WAITING"  # States: WAITING, FIRST_TAP, BETWEEN_TAPS, SECOND_TAP
+        self.help_state = HELP_WAITING
         self.first_tap_time = 0
-        self.help_max_time = 1.5  # Maximum time to complete double tap (seconds)
-        self.help_min_between_time = 0.3  # Minimum time between taps (seconds)
+        self.help_max_time_ns = int(1.5e9)  # Maximum time to complete double tap (1.5 s)
+        self.help_min_between_time_ns = int(0.3e9)  # Minimum time between taps (0.3 s)
         
-        # Zoom mode state
+        # Zoom mode state, and the minimum squared spreads between adjacent fingertips
+        # (thumb-index, index-middle, middle-ring, ring-pinky) for the open-palm pose
         self.zoom_mode_active = False
+        self.finger_spread_thresholds_sq = np.array([0.05, 0.03, 0.03, 0.03], dtype=np.float32) ** 2
         
         # Emit initial status
         self.status_signal.emit("Gesture recognition started")
         
-    def release(self):
-        """Release camera resources"""
-        if hasattr(self, 'cap') and self.cap is not None:
-            self.cap.release()
+    def open_camera(self):
+        """Open the webcam in MJPEG with a reduced resolution, fixed frame rate and a one-frame buffer"""
+        # The V4L2 backend delivers frames noticeably faster than the default one on Linux
+        if sys.platform.startswith("linux"):
+            cap = cv2.VideoCapture(0, cv2.CAP_V4L2)
+        else:
+            cap = cv2.VideoCapture(0)
+        
+        # Ask for MJPEG: compressed frames use far less USB bandwidth than raw YUYV and are
+        # decoded by libjpeg-turbo. Set before the size, since some drivers reset the size on
+        # a format change.
+        mjpeg = cv2.VideoWriter_fourcc(*"MJPG")
+        cap.set(cv2.CAP_PROP_FOURCC, mjpeg)
+        if int(cap.get(cv2.CAP_PROP_FOURCC)) != mjpeg:
+            # Reported on stderr: open_camera runs before any status slot is connected
+            print("Camera does not support MJPEG, using its default format", file=sys.stderr)
+        
+        cap.set(cv2.CAP_PROP_FRAME_WIDTH, self.capture_width)
+        cap.set(cv2.CAP_PROP_FRAME_HEIGHT, self.capture_height)
+        cap.set(cv2.CAP_PROP_FPS, self.capture_fps)
+        
+        # Not every backend supports the buffer size. The capture thread reads continuously
+        # either way, so a larger driver buffer is drained instead of queuing stale frames.
+        if not cap.set(cv2.CAP_PROP_BUFFERSIZE, 1):
+            print("Camera does not support a one-frame buffer", file=sys.stderr)
+        return cap
     
-    def process_frame(self):
-        """Process the current frame and detect gestures"""
+    def start(self):
+        """Start the capture and inference threads"""
         if not self.cap.isOpened():
             self.status_signal.emit("Error: Camera not available")
             return
         
-        # Read frame from webcam
-        ret, frame = self.cap.read()
-        if not ret:
-            return
-        
-        # Mirror the frame horizontally for more intuitive interaction
-        frame = cv2.flip(frame, 1)
-        
-        # Convert to RGB for MediaPipe
-        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        
-        # Clone the original BGR frame for drawing landmarks and debug info
-        # Using BGR frame for display to keep original camera colors
-        debug_frame = frame.copy()
-        
-        # Reset debug info for detection, but keep gesture recognition message
-        old_gesture = None
-        if hasattr(self, 'current_gesture_text') and self.current_gesture_text:
-            old_gesture = self.current_gesture_text
-        self.debug_info = ""
-        
-        # Process the frame with MediaPipe Hands and Pose
-        hand_results = self.hands.process(rgb_frame)
-        pose_results = self.pose.process(rgb_frame)
-        
-        # Clear debug info for this frame but keep it structured
-        self.debug_info = "Gesture Recognition Status\n"
-        self.debug_info += "======================\n"
+        self.inference_thread.start()
+        self.capture_thread.start()
+    
+    def release(self):
+        """Stop the worker threads and release camera resources"""
+        for thread in (self.capture_thread, self.inference_thread):
+            thread.requestInterruption()
+            thread.wait()
         
-        # Add persistent gesture text if it exists
-        if hasattr(self, 'current_gesture_text') and self.current_gesture_text:
-            self.debug_info += "\n------------------------\n"
-            self.debug_info += f"{self.current_gesture_text}\n"
-            self.debug_info += "------------------------\n"
+        if self.cap is not None:
+            self.cap.release()
+    
+    def set_debug_enabled(self, enabled):
+        """Enable or disable collecting debug text and frames (follows the debug window visibility)"""
+        self.debug_enabled = enabled
+        self.inference_thread.debug_enabled = enabled
+        self.collect_debug = False
+        self.debug_lines.clear()
+    
+    @pyqtSlot(object, object)
+    def process_results(self, hand_results, pose_results):
+        """Detect gestures from the MediaPipe results of the latest frame"""
+        # Read the clock once; all detectors use this frame's timestamp
+        current_time = self.frame_time = time.monotonic_ns()
+        
+        # Start this frame's debug lines, only collected while the debug window is shown
+        self.collect_debug = (self.debug_enabled and
+                              current_time - self.last_debug_text_time >= self.debug_text_interval_ns)
+        if self.collect_debug:
+            self.debug_lines.append("Gesture Recognition Status")
+            self.debug_lines.append("======================")
+            
+            # Add persistent gesture text if it exists
+            if self.current_gesture_text:
+                self.debug_lines.append("")
+                self.debug_lines.append("------------------------")
+                self.debug_lines.append(self.current_gesture_text)
+                self.debug_lines.append("------------------------")
         
         # Check for gestures if the cooldown period has passed
-        current_time = time.time()
-        
-        if current_time - self.last_gesture_time >= self.gesture_cooldown:
+        if current_time - self.last_gesture_time >= self.gesture_cooldown_ns:
             # Analyze hand poses and detect gestures
-            self.detect_gestures(hand_results, pose_results, debug_frame)
-        
-        # Draw hand landmarks on debug frame
-        if hand_results.multi_hand_landmarks:
-            for hand_landmarks in hand_results.multi_hand_landmarks:
-                self.mp_drawing.draw_landmarks(
-                    debug_frame,
-                    hand_landmarks,
-                    self.mp_hands.HAND_CONNECTIONS,
-                    self.mp_drawing_styles.get_default_hand_landmarks_style(),
-                    self.mp_drawing_styles.get_default_hand_connections_style()
-                )
-        
-        # Draw key pose landmarks on the debug frame (temple and hips)
-        if pose_results.pose_landmarks:
-            # Extract the landmark coordinates
-            pose_landmarks = pose_results.pose_landmarks.landmark
-            temple_point = pose_landmarks[self.mp_pose.PoseLandmark.LEFT_EYE_OUTER.value]  # Mirrored, appears on right side
-            
-            # Get hip landmarks (left and right are swapped due to mirroring)
-            left_hip = pose_landmarks[self.mp_pose.PoseLandmark.RIGHT_HIP.value]  # Appears on left side when mirrored
-            right_hip = pose_landmarks[self.mp_pose.PoseLandmark.LEFT_HIP.value]  # Appears on right side when mirrored
-            
-            # Convert normalized coordinates to pixel coordinates
-            h, w, _ = debug_frame.shape
-            
-            # Temple point
-            temple_x = int(temple_point.x * w)
-            temple_y = int(temple_point.y * h)
-            
-            # Hip points
-            left_hip_x = int(left_hip.x * w)
-            left_hip_y = int(left_hip.y * h)
-            right_hip_x = int(right_hip.x * w)
-            right_hip_y = int(right_hip.y * h)
-            
-            # Draw circles at the key points
-            # Temple - red circle with green center
-            cv2.circle(debug_frame, (temple_x, temple_y), 8, (0, 0, 255), -1)  # Red outer circle
-            cv2.circle(debug_frame, (temple_x, temple_y), 4, (0, 255, 0), -1)  # Green inner circle
-            
-            # Left hip (appears on left in mirrored view) - blue circle with yellow center
-            cv2.circle(debug_frame, (left_hip_x, left_hip_y), 8, (255, 0, 0), -1)  # Blue outer circle
-            cv2.circle(debug_frame, (left_hip_x, left_hip_y), 4, (0, 255, 255), -1)  # Yellow inner circle
-            
-            # Right hip (appears on right in mirrored view) - purple circle with cyan center
-            cv2.circle(debug_frame, (right_hip_x, right_hip_y), 8, (255, 0, 255), -1)  # Purple outer circle
-            cv2.circle(debug_frame, (right_hip_x, right_hip_y), 4, (255, 255, 0), -1)  # Cyan inner circle
-            
-            # Add labels next to the points
-            cv2.putText(debug_frame, "Temple", (temple_x + 10, temple_y), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 0, 255), 1)
-            cv2.putText(debug_frame, "Left Hip", (left_hip_x + 10, left_hip_y), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 0, 0), 1)
-            cv2.putText(debug_frame, "Right Hip", (right_hip_x + 10, right_hip_y), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 0, 255), 1)
-        
-        # Convert the BGR debug frame to RGB for QImage
-        rgb_debug_frame = cv2.cvtColor(debug_frame, cv2.COLOR_BGR2RGB)
-        
-        # Convert the debug frame to QImage for display in debug window
-        h, w, ch = rgb_debug_frame.shape
-        bytes_per_line = ch * w
-        convert_to_qt_format = QImage(rgb_debug_frame.data, w, h, bytes_per_line, QImage.Format_RGB888)
-        qt_image = convert_to_qt_format.scaled(640, 480)
-        
-        # Emit the signals for debug window
-        self.debug_frame_signal.emit(qt_image)
-        self.debug_text_signal.emit(self.debug_info)
+            self.detect_gestures(hand_results, pose_results)
+        
+        # Emit the debug text for the debug window
+        if self.collect_debug:
+            self.debug_text_signal.emit("\n".join(self.debug_lines))
+            self.debug_lines.clear()
+            self.last_debug_text_time = current_time
 
-    def detect_gestures(self, hand_results, pose_results, debug_frame):
+    def detect_gestures(self, hand_results, pose_results):
         """Detect gestures based on hand and pose landmarks"""
         # Initialize empty landmarks for left and right hands
         left_hand = None
@@ -215,155 +221,179 @@ class GestureRecognizer(QObject):
                 
             # Extract handedness information correctly
             handedness = hand_results.multi_handedness[i].classification[0].label
-            landmarks = hand_landmarks.landmark
             
-            # Store landmarks based on handedness - corrected assignment
+            # Store landmarks based on handedness - corrected assignment. The 21 landmarks
+            # are packed once into a (21, 3) array used by all detectors.
             if handedness == "Left":  # Left hand in the camera view
-                left_hand = landmarks
-                self.debug_info += "Hand detected: LEFT\n"
+                left_hand = self.fill_landmarks(self.left_hand_points, hand_landmarks.landmark)
+                if self.collect_debug:
+                    self.debug_lines.append("Hand detected: LEFT")
             elif handedness == "Right":  # Right hand in the camera view
-                right_hand = landmarks
-                self.debug_info += "Hand detected: RIGHT\n"
+                right_hand = self.fill_landmarks(self.right_hand_points, hand_landmarks.landmark)
+                if self.collect_debug:
+                    self.debug_lines.append("Hand detected: RIGHT")
         
         # Add zoom mode status if active
-        if self.zoom_mode_active:
-            self.debug_info += "ZOOM MODE ACTIVE\n"
+        if self.zoom_mode_active and self.collect_debug:
+            self.debug_lines.append("ZOOM MODE ACTIVE")
+        
+        # Squared distances from the right index tip to the temple, left hip and right hip
+        target_distances_sq = None
+        if right_hand is not None and pose_landmarks:
+            target_distances_sq = self.calculate_target_distances_sq(right_hand[8], pose_landmarks)
+        
+        # Only one gesture fires per frame (the cooldown blocks the rest anyway), so the
+        # remaining detectors are skipped as soon as one of them triggers
         
         # Detect Help gesture (double tap on right temple)
-        if right_hand:
-            self.detect_help_gesture(right_hand, pose_landmarks)
+        if target_distances_sq is not None:
+            self.detect_help_gesture(target_distances_sq[0])
+            if self.gesture_triggered():
+                return
         
         # Detect Increase/Decrease gestures if both hands are visible
-        if left_hand and right_hand:
+        if left_hand is not None and right_hand is not None:
             self.detect_zoom_gestures(left_hand, right_hand)
+            if self.gesture_triggered():
+                return
         
-        # Detect Next gesture (touch left hip with right index)
-        if right_hand and pose_landmarks:
-            self.detect_next_gesture(right_hand, pose_landmarks)
-            
-        # Detect Previous gesture (touch right hip with right index)
-        if right_hand and pose_landmarks:
-            self.detect_previous_gesture(right_hand, pose_landmarks)
+        # Detect Next (touch left hip) or Previous (touch right hip) with right index
+        if target_distances_sq is not None:
+            self.detect_hip_gestures(target_distances_sq[1:])
+
+    def calculate_target_distances_sq(self, index_tip, pose_landmarks):
+        """Calculate squared distances from the index tip to the temple, left hip and right hip in one batch"""
+        targets = self.fill_landmarks(self.pose_target_points, (
+            pose_landmarks[self.temple_index],
+            pose_landmarks[self.left_hip_index],
+            pose_landmarks[self.right_hip_index]
+        ))
+        diffs = np.subtract(targets, index_tip, out=self.pose_target_diffs)
+        
+        # Temple touch is measured in the X-Y plane only, as depth (Z) is less reliable
+        diffs[0, 2] = 0.0
+        
+        return np.einsum('ij,ij->i', diffs, diffs)
+    
+    def detect_hip_gestures(self, hip_distances_sq):
+        """Detect Next/Previous gestures from squared index-tip distances to the left and right hip"""
+        # Detect Next - right index touches left hip
+        if hip_distances_sq[0] < self.touch_threshold_sq:
+            self.next_signal.emit()
+            self.update_debug_and_trigger("Next (Left Hip Touch)")
+        
+        # Detect Previous - right index touches right hip
+        elif hip_distances_sq[1] < self.touch_threshold_sq:
+            self.previous_signal.emit()
+            self.update_debug_and_trigger("Previous (Right Hip Touch)")
+
+    def fill_landmarks(self, points, landmarks):
+        """Write the x, y, z coordinates of MediaPipe landmarks into a preallocated (N, 3) array"""
+        # One bulk assignment instead of a NumPy item write per coordinate
+        points[:] = [(lm.x, lm.y, lm.z) for lm in landmarks]
+        return points
 
-    def calculate_distance(self, point1, point2):
-        """Calculate Euclidean distance between two points in 3D space"""
-        return np.sqrt((point1.x - point2.x)**2 + 
-                    (point1.y - point2.y)**2 + 
-                    (point1.z - point2.z)**2)
+    def calculate_distances_sq(self, points1, points2):
+        """Calculate squared Euclidean distances between rows of two point arrays in one call"""
+        diffs = points1 - points2
+        return np.einsum('ij,ij->i', diffs, diffs)
 
-    def is_finger_extended(self, landmarks, finger_tip_idx, finger_pip_idx):
-        """Check if a finger is extended by comparing the y-coordinates of tip and PIP joint"""
-        return landmarks[finger_tip_idx].y < landmarks[finger_pip_idx].y
+    def gesture_triggered(self):
+        """Check if a gesture was triggered while processing the current frame"""
+        return self.last_gesture_time == self.frame_time
 
     def update_debug_and_trigger(self, gesture_name):
         """Update the last gesture time, add to debug info, and emit status signal"""
-        self.last_gesture_time = time.time()
+        self.last_gesture_time = self.frame_time
         
         # Store the current gesture text for persistent display
         self.current_gesture_text = f"GESTURE RECOGNIZED: {gesture_name}"
         
         # Make the gesture detection more prominent in the debug window
-        self.debug_info += "\n------------------------\n"
-        self.debug_info += f"GESTURE RECOGNIZED: {gesture_name}\n"
-        self.debug_info += "------------------------\n"
+        if self.collect_debug:
+            self.debug_lines.append("")
+            self.debug_lines.append("------------------------")
+            self.debug_lines.append(self.current_gesture_text)
+            self.debug_lines.append("------------------------")
         
         self.status_signal.emit(f"Gesture: {gesture_name}")
         
-    def calculate_temple_distance(self, index_tip, temple):
-        """Calculate 2D distance between finger tip and temple (ignoring Z)"""
-        # Focus mainly on X-Y plane as depth (Z) is less reliable
-        return np.sqrt((index_tip.x - temple.x)**2 + (index_tip.y - temple.y)**2) * 1.5
-    
-    def detect_help_gesture(self, right_hand, pose_landmarks):
+    def detect_help_gesture(self, distance_sq):
         """Detect Help gesture: Double tap on right temple with right index finger"""
-        # Make sure we have pose landmarks for the temple
-        if not pose_landmarks:
-            return
-            
-        # Get the coordinates of the right index finger tip and the temple area
-        # Using LEFT_EYE_OUTER landmark since the frame is mirrored
-        index_tip = right_hand[8]  # Index finger tip
-        temple = pose_landmarks[self.mp_pose.PoseLandmark.LEFT_EYE_OUTER.value]  # Temple area in mirrored view
-        
-        # Define temple threshold for help gesture (more sensitive than general touch)  
-        temple_threshold = 0.1
-        
-        # Use specialized 2D distance calculation for temple touch
-        distance = self.calculate_temple_distance(index_tip, temple)
-        
-        # Add debug info for temple distance
-        self.debug_info += f"Temple touch distance: {distance:.4f} (threshold: {temple_threshold:.4f})\n"
+        # Add debug info for temple distance, shown with the 1.5 scale applied
+        if self.collect_debug:
+            distance = math.sqrt(distance_sq) * 1.5
+            self.debug_lines.append(f"Temple touch distance: {distance:.4f} (threshold: {self.temple_threshold:.4f})")
         
         # State machine for double tap detection
-        current_time = time.time()
+        current_time = self.frame_time
         
         # Check for timeout in any intermediate state
-        if self.help_state != "WAITING" and current_time - self.first_tap_time > self.help_max_time:
-            self.help_state = "WAITING"
-            self.debug_info += "Help gesture timed out\n"
+        if self.help_state != HELP_WAITING and current_time - self.first_tap_time > self.help_max_time_ns:
+            self.help_state = HELP_WAITING
+            if self.collect_debug:
+                self.debug_lines.append("Help gesture timed out")
         
         # State machine logic
-        if self.help_state == "WAITING":
+        if self.help_state == HELP_WAITING:
             # Check for first tap
-            if distance < temple_threshold:
-                self.help_state = "FIRST_TAP"
+            if distance_sq < self.temple_touch_threshold_sq:
+                self.help_state = HELP_FIRST_TAP
                 self.first_tap_time = current_time
-                self.debug_info += "First tap detected\n"
+                if self.collect_debug:
+                    self.debug_lines.append("First tap detected")
         
-        elif self.help_state == "FIRST_TAP":
+        elif self.help_state == HELP_FIRST_TAP:
             # Check if finger is moved away from temple
-            if distance > temple_threshold * 1.5:
-                self.help_state = "BETWEEN_TAPS"
-                self.debug_info += "Finger moved away from temple\n"
+            if distance_sq > self.temple_release_threshold_sq:
+                self.help_state = HELP_BETWEEN_TAPS
+                if self.collect_debug:
+                    self.debug_lines.append("Finger moved away from temple")
         
-        elif self.help_state == "BETWEEN_TAPS":
+        elif self.help_state == HELP_BETWEEN_TAPS:
             # Check minimum time between taps
             time_between = current_time - self.first_tap_time
-            if time_between >= self.help_min_between_time:
+            if time_between >= self.help_min_between_time_ns:
                 # Check for second tap
-                if distance < temple_threshold:
-                    self.help_state = "SECOND_TAP"
-                    self.debug_info += "Second tap detected\n"
+                if distance_sq < self.temple_touch_threshold_sq:
+                    self.help_state = HELP_SECOND_TAP
+                    if self.collect_debug:
+                        self.debug_lines.append("Second tap detected")
                     # Emit help signal
                     self.help_signal.emit()
                     self.update_debug_and_trigger("Help (Double tap on right temple)")
-            else:
-                self.debug_info += f"Waiting for minimum tap interval: {time_between:.2f}s\n"
+            elif self.collect_debug:
+                self.debug_lines.append(f"Waiting for minimum tap interval: {time_between / 1e9:.2f}s")
         
-        elif self.help_state == "SECOND_TAP":
+        elif self.help_state == HELP_SECOND_TAP:
             # Reset state if finger moved away
-            if distance > temple_threshold * 1.5:
-                self.help_state = "WAITING"
-                self.debug_info += "Help gesture completed\n"
+            if distance_sq > self.temple_release_threshold_sq:
+                self.help_state = HELP_WAITING
+                if self.collect_debug:
+                    self.debug_lines.append("Help gesture completed")
     
     def detect_zoom_mode(self, left_hand):
         """Detect Zoom Mode Activation: Left hand palm facing user with all fingers spread"""
-        # Check if all fingers are extended
-        thumb_extended = left_hand[4].y < left_hand[3].y  # Thumb tip is higher than thumb IP
-        index_extended = self.is_finger_extended(left_hand, 8, 6)  # Index tip vs PIP
-        middle_extended = self.is_finger_extended(left_hand, 12, 10)  # Middle tip vs PIP
-        ring_extended = self.is_finger_extended(left_hand, 16, 14)  # Ring tip vs PIP
-        pinky_extended = self.is_finger_extended(left_hand, 20, 18)  # Pinky tip vs PIP
-        
-        # Check if fingers are sufficiently spread apart
-        thumb_to_index = self.calculate_distance(left_hand[4], left_hand[8])
-        index_to_middle = self.calculate_distance(left_hand[8], left_hand[12])
-        middle_to_ring = self.calculate_distance(left_hand[12], left_hand[16])
-        ring_to_pinky = self.calculate_distance(left_hand[16], left_hand[20])
+        # Check if all fingers are extended: each tip above the joint below it (thumb IP, finger PIPs)
+        tips = left_hand[FINGERTIP_INDICES]
+        all_fingers_extended = bool((tips[:, 1] < left_hand[FINGER_JOINT_INDICES, 1]).all())
+        
+        # Check if fingers are sufficiently spread apart: squared distances between adjacent tips
+        # (thumb-index, index-middle, middle-ring, ring-pinky) in one call
+        tip_gaps = np.diff(tips, axis=0)
+        spreads_sq = np.einsum('ij,ij->i', tip_gaps, tip_gaps)
+        fingers_spread = bool((spreads_sq > self.finger_spread_thresholds_sq).all())
         
         # Palm facing detection - simplified check based on relative z positions of palm and knuckles
         palm_point = left_hand[0]  # Palm base landmark
         index_mcp = left_hand[5]  # Index finger MCP (knuckle)
         
         # Check if palm is facing camera (palm point should be further from camera than knuckles)
-        palm_facing = palm_point.z < index_mcp.z
+        palm_facing = palm_point[2] < index_mcp[2]
         
         # Simplified - removed detailed debug information
         
         # All conditions must be true to activate zoom mode
-        all_fingers_extended = thumb_extended and index_extended and middle_extended and ring_extended and pinky_extended
-        fingers_spread = thumb_to_index > 0.05 and index_to_middle > 0.03 and middle_to_ring > 0.03 and ring_to_pinky > 0.03
-        
         if all_fingers_extended and fingers_spread and palm_facing and not self.zoom_mode_active:
             # Activate zoom mode
             self.zoom_mode_active = True
@@ -375,53 +405,20 @@ class GestureRecognizer(QObject):
     
     def detect_zoom_gestures(self, left_hand, right_hand):
         """Detect Increase/Decrease gestures based on finger touches"""
-        # Get finger tips
-        right_index_tip = right_hand[8]  # Right hand index finger tip
-        left_index_tip = left_hand[8]  # Left hand index finger tip
-        left_pinky_tip = left_hand[20]  # Left hand pinky finger tip
-        
-        # Calculate distances
-        right_to_left_index = self.calculate_distance(right_index_tip, left_index_tip)
-        right_to_left_pinky = self.calculate_distance(right_index_tip, left_pinky_tip)
+        # Distances from the right index tip to the left index tip and left pinky tip
+        right_to_left_index_sq, right_to_left_pinky_sq = self.calculate_distances_sq(left_hand[[8, 20]], right_hand[8])
         
         # Add debug info for distances
-        self.debug_info += f"Index-to-Index distance: {right_to_left_index:.4f} (threshold: {self.finger_touch_threshold:.4f})\n"
-        self.debug_info += f"Index-to-Pinky distance: {right_to_left_pinky:.4f} (threshold: {self.finger_touch_threshold:.4f})\n"
+        if self.collect_debug:
+            self.debug_lines.append(f"Index-to-Index distance: {math.sqrt(right_to_left_index_sq):.4f} (threshold: {self.finger_touch_threshold:.4f})")
+            self.debug_lines.append(f"Index-to-Pinky distance: {math.sqrt(right_to_left_pinky_sq):.4f} (threshold: {self.finger_touch_threshold:.4f})")
         
         # Detect Increase/Fullscreen - right index touches left index
-        if right_to_left_index < self.finger_touch_threshold:
+        if right_to_left_index_sq < self.finger_touch_threshold_sq:
             self.increase_signal.emit()
             self.update_debug_and_trigger("Fullscreen Mode Activated")
         
         # Detect Decrease/Normal view - right index touches left pinky
-        elif right_to_left_pinky < self.finger_touch_threshold:
+        elif right_to_left_pinky_sq < self.finger_touch_threshold_sq:
             self.decrease_signal.emit()
             self.update_debug_and_trigger("Normal View Restored")
-    
-    def detect_next_gesture(self, right_hand, pose_landmarks):
-        """Detect Next gesture: touch left hip with right index finger"""
-        # Get the coordinates of the right index finger tip and the left hip
-        index_tip = right_hand[8]  # Index finger tip
-        left_hip = pose_landmarks[self.mp_pose.PoseLandmark.LEFT_HIP.value]
-        
-        # Calculate distance
-        distance = self.calculate_distance(index_tip, left_hip)
-        
-        # Detect touch
-        if distance < self.touch_threshold:
-            self.next_signal.emit()
-            self.update_debug_and_trigger("Next (Left Hip Touch)")
-    
-    def detect_previous_gesture(self, right_hand, pose_landmarks):
-        """Detect Previous gesture: touch right hip with right index finger"""
-        # Get the coordinates of the right index finger tip and the right hip
-        index_tip = right_hand[8]  # Index finger tip
-        right_hip = pose_landmarks[self.mp_pose.PoseLandmark.RIGHT_HIP.value]
-        
-        # Calculate distance
-        distance = self.calculate_distance(index_tip, right_hip)
-        
-        # Detect touch
-        if distance < self.touch_threshold:
-            self.previous_signal.emit()
-            self.update_debug_and_trigger("Previous (Right Hip Touch)")
@@ -0,0 +1,316 @@
+"""
+Video pipeline component running camera capture and MediaPipe inference off the Qt thread
+"""
+import dataclasses
+import queue
+import time
+from concurrent.futures import ThreadPoolExecutor
+import cv2
+import numpy as np
+import mediapipe as mp
+from PyQt5.QtCore import QThread, pyqtSignal
+from PyQt5.QtGui import QImage
+
+def rgb_drawing_style(style):
+    """Return a copy of a MediaPipe drawing style with its BGR colors converted to RGB"""
+    return {key: dataclasses.replace(spec, color=spec.color[::-1]) for key, spec in style.items()}
+
+def put_latest(frame_queue, item):
+    """Put an item into a single-slot queue, replacing any item the consumer has not taken yet"""
+    try:
+        frame_queue.get_nowait()
+    except queue.Empty:
+        pass
+    frame_queue.put_nowait(item)
+
+class CaptureThread(QThread):
+    """
+    Producer thread that reads camera frames and keeps only the latest one for the inference thread
+    """
+    def __init__(self, cap, frame_queue, frame_request):
+        super().__init__()
+        self.cap = cap
+        self.frame_queue = frame_queue
+        self.frame_request = frame_request
+    
+    def run(self):
+        """Grab frames until interrupted, so the driver buffer never fills up with stale frames"""
+        while not self.isInterruptionRequested():
+            if not self.cap.grab():
+                # Avoid spinning while the camera is not delivering frames
+                self.msleep(10)
+                continue
+            
+            # Only decode the frame when the inference thread is waiting for one;
+            # frames grabbed while it is busy are dropped without decoding
+            if not self.frame_request.is_set():
+                continue
+            
+            ret, frame = self.cap.retrieve()
+            if ret:
+                self.frame_request.clear()
+                put_latest(self.frame_queue, frame)
+
+class InferenceThread(QThread):
+    """
+    Consumer thread that runs MediaPipe Hands and Pose on the latest frame and renders the debug view
+    """
+    # Emitted with the MediaPipe Hands and Pose results of every processed frame
+    results_signal = pyqtSignal(object, object)
+    # Emitted with a detached copy of the annotated debug frame
+    debug_frame_signal = pyqtSignal(QImage)
+    
+    def __init__(self, frame_queue, frame_request, parallel_inference=True):
+        super().__init__()
+        self.frame_queue = frame_queue
+        self.frame_request = frame_request
+        
+        # Hands and Pose release the GIL while inferring, so on frames where both run they can
+        # overlap on a second worker thread. Disable on single-core machines.
+        self.parallel_inference = parallel_inference
+        self.pose_executor = None
+        
+        # Initialize MediaPipe solutions
+        self.mp_drawing = mp.solutions.drawing_utils
+        self.mp_drawing_styles = mp.solutions.drawing_styles
+        self.mp_hands = mp.solutions.hands
+        self.mp_pose = mp.solutions.pose
+        
+        # Pose landmark indices drawn every frame, cached as ints
+        self.temple_index = int(self.mp_pose.PoseLandmark.LEFT_EYE_OUTER)
+        self.left_hip_index = int(self.mp_pose.PoseLandmark.LEFT_HIP)
+        self.right_hip_index = int(self.mp_pose.PoseLandmark.RIGHT_HIP)
+        
+        # Key pose markers drawn on the debug frame: landmark index, label, outer and inner
+        # circle colors (RGB). Left and right hips are swapped due to mirroring.
+        self.pose_markers = (
+            (self.temple_index, "Temple", (255, 0, 0), (0, 255, 0)),  # Red with green center
+            (self.right_hip_index, "Left Hip", (0, 0, 255), (255, 255, 0)),  # Blue with yellow center
+            (self.left_hip_index, "Right Hip", (255, 0, 255), (0, 255, 255))  # Purple with cyan center
+        )
+        
+        # Hand drawing styles, built once and converted to RGB since landmarks are drawn on the RGB frame
+        self.hand_landmarks_style = rgb_drawing_style(self.mp_drawing_styles.get_default_hand_landmarks_style())
+        self.hand_connections_style = rgb_drawing_style(self.mp_drawing_styles.get_default_hand_connections_style())
+        
+        # Initialize MediaPipe Hands and Pose detection. While only one hand is tracked, the
+        # two-hand model keeps running palm detection to look for the missing hand, so a
+        # single-hand model takes over while it tracks the right hand alone (the hand the
+        # single-hand gestures use) and no two-hand gesture was recent.
+        self.hands = self.mp_hands.Hands(
+            static_image_mode=False,
+            max_num_hands=2,
+            model_complexity=0,  # Lite landmark model, roughly twice as fast
+            min_detection_confidence=0.7,
+            min_tracking_confidence=0.5
+        )
+        self.single_hand = self.mp_hands.Hands(
+            static_image_mode=False,
+            max_num_hands=1,
+            model_complexity=0,
+            min_detection_confidence=0.7,
+            min_tracking_confidence=0.5
+        )
+        self.last_hand_count = 0
+        self.last_hand_label = None  # Handedness of the only hand in the last frame
+        # Keep the two-hand model for a while after both hands were seen (zoom gestures), and
+        # let it check every Nth frame for a second hand, which the single-hand model can't find
+        self.two_hand_hold_frames = 30
+        self.last_two_hand_frame = -self.two_hand_hold_frames
+        self.two_hand_probe_interval = 5
+        
+        # With no hands in view for a while, back off to a lower frame rate until one appears
+        self.idle_timeout = 1.0  # Seconds without hands before backing off
+        self.idle_frame_delay_ms = 100
+        self.last_activity_time = 0.0
+        
+        self.pose = self.mp_pose.Pose(
+            static_image_mode=False,
+            model_complexity=0,  # Lite model is accurate enough for temple and hips
+            enable_segmentation=False,
+            min_detection_confidence=0.7,
+            min_tracking_confidence=0.5
+        )
+        
+        # Pose landmarks (temple and hips) move slowly, so pose runs on every Nth frame only
+        # and its latest results are reused in between
+        self.pose_interval = 3
+        self.frame_count = 0
+        self.hand_results = None
+        self.pose_results = None
+        
+        # Static scene detection: frames whose 32x24 thumbnail differs from that of the last inferred
+        # frame by less than the threshold on every pixel reuse its results, with a full run every Nth frame
+        self.thumbnail_size = (32, 24)
+        self.thumbnails = tuple(np.empty((24, 32, 3), dtype=np.uint8) for _ in range(2))
+        self.thumbnail_diff = np.empty((24, 32, 3), dtype=np.uint8)
+        self.static_threshold = 8
+        self.static_revalidate_interval = 10
+        self.static_frame_count = 0
+        
+        # The debug frame is only drawn and sent while the debug window is visible
+        self.debug_enabled = False
+        
+        # RGB frame buffer reused across frames (allocated on the first frame), and the
+        # QImage wrapping it for the debug view
+        self.rgb_buffer = None
+        self.rgb_image = None
+    
+    def run(self):
+        """Process the latest captured frame until interrupted"""
+        if self.parallel_inference:
+            self.pose_executor = ThreadPoolExecutor(max_workers=1)
+        
+        try:
+            while not self.isInterruptionRequested():
+                # Ask the capture thread for the next frame, and wake up regularly
+                # to check for interruption when no frames arrive
+                self.frame_request.set()
+                try:
+                    frame = self.frame_queue.get(timeout=0.1)
+                except queue.Empty:
+                    continue
+                
+                self.process_frame(frame)
+                
+                if self.last_hand_count:
+                    self.last_activity_time = time.monotonic()
+                elif time.monotonic() - self.last_activity_time > self.idle_timeout:
+                    self.msleep(self.idle_frame_delay_ms)
+        finally:
+            if self.pose_executor is not None:
+                self.pose_executor.shutdown()
+                self.pose_executor = None
+    
+    def process_frame(self, frame):
+        """Run hand and pose detection on a frame and emit the results and the debug view"""
+        # Allocate the RGB buffer once the frame size is known
+        if self.rgb_buffer is None or self.rgb_buffer.shape != frame.shape:
+            h, w, ch = frame.shape
+            self.rgb_buffer = np.empty_like(frame)
+            self.rgb_image = QImage(self.rgb_buffer.data, w, h, ch * w, QImage.Format_RGB888)
+        
+        # A frame that barely differs from the previous one reuses its results, and
+        # without the debug view it needs no conversion either
+        static = self.is_static_frame(frame)
+        if static and not self.debug_enabled:
+            self.results_signal.emit(self.hand_results, self.pose_results)
+            return
+        
+        # Convert to RGB once; the same frame feeds MediaPipe and, after inference, the debug view
+        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=self.rgb_buffer)
+        
+        # Mirror the frame horizontally for more intuitive interaction, in place
+        cv2.flip(rgb_frame, 1, dst=rgb_frame)
+        
+        if static:
+            hand_results, pose_results = self.hand_results, self.pose_results
+        else:
+            hand_results, pose_results = self.run_inference(rgb_frame)
+        
+        # Hand the results to the gesture recognizer on the GUI thread
+        self.results_signal.emit(hand_results, pose_results)
+        
+        # Drawing and sending the debug view is skipped entirely while nobody is looking at it
+        if not self.debug_enabled:
+            return
+        
+        # Draw the landmarks directly on the RGB frame, which MediaPipe no longer needs
+        self.draw_debug_frame(rgb_frame, hand_results, pose_results)
+        
+        # The debug window scales the frame to its label, so it is sent at capture size.
+        # The buffer is overwritten by the next frame, so send the GUI thread its own copy.
+        self.debug_frame_signal.emit(self.rgb_image.copy())
+    
+    def is_static_frame(self, frame):
+        """Check if a frame barely differs from the last inferred one, by comparing tiny thumbnails"""
+        thumbnail, reference = self.thumbnails
+        cv2.resize(frame, self.thumbnail_size, dst=thumbnail, interpolation=cv2.INTER_AREA)
+        
+        # Run full inference regularly even on a still scene, and always before results exist.
+        # The largest change of any thumbnail pixel catches small movements like a finger tap,
+        # which a mean over the whole frame would average away.
+        static = False
+        if self.hand_results is not None and self.static_frame_count < self.static_revalidate_interval:
+            cv2.absdiff(thumbnail, reference, dst=self.thumbnail_diff)
+            static = self.thumbnail_diff.max() < self.static_threshold
+        
+        if static:
+            self.static_frame_count += 1
+        else:
+            # This frame will be inferred and becomes the reference, so slow drifts can't add up
+            self.static_frame_count = 0
+            self.thumbnails = (reference, thumbnail)
+        return static
+    
+    def run_inference(self, rgb_frame):
+        """Run MediaPipe Hands and, on every Nth frame, Pose on an RGB frame"""
+        # Marking the reused RGB buffer read-only lets MediaPipe wrap it by reference
+        # instead of copying it for each model
+        rgb_frame.flags.writeable = False
+        hands = self.select_hands_model()
+        run_pose = self.pose_results is None or self.frame_count % self.pose_interval == 0
+        if run_pose and self.pose_executor is not None:
+            # Run pose on the worker while hands runs here, then wait for both
+            pose_future = self.pose_executor.submit(self.pose.process, rgb_frame)
+            hand_results = hands.process(rgb_frame)
+            self.pose_results = pose_future.result()
+        else:
+            hand_results = hands.process(rgb_frame)
+            if run_pose:
+                self.pose_results = self.pose.process(rgb_frame)
+        rgb_frame.flags.writeable = True
+        self.frame_count += 1
+        self.hand_results = hand_results
+        self.last_hand_count = len(hand_results.multi_hand_landmarks or ())
+        if self.last_hand_count == 1 and hand_results.multi_handedness:
+            self.last_hand_label = hand_results.multi_handedness[0].classification[0].label
+        else:
+            self.last_hand_label = None
+        if self.last_hand_count >= 2:
+            self.last_two_hand_frame = self.frame_count
+        return hand_results, self.pose_results
+    
+    def select_hands_model(self):
+        """Pick the single-hand model only while it tracks the right hand alone, otherwise the two-hand one"""
+        # Any other hand (or none) may be the wrong lock-on or the start of a two-hand gesture
+        if self.last_hand_label != "Right":
+            return self.hands
+        
+        # Stay on the two-hand model while a two-hand gesture is recent
+        if self.frame_count - self.last_two_hand_frame < self.two_hand_hold_frames:
+            return self.hands
+        
+        # Regularly let the two-hand model look for a second hand entering the view
+        if self.frame_count % self.two_hand_probe_interval == 0:
+            return self.hands
+        return self.single_hand
+    
+    def draw_debug_frame(self, debug_frame, hand_results, pose_results):
+        """Draw hand landmarks and the key pose landmarks (temple and hips) on the debug frame"""
+        # Draw hand landmarks on debug frame
+        if hand_results.multi_hand_landmarks:
+            for hand_landmarks in hand_results.multi_hand_landmarks:
+                self.mp_drawing.draw_landmarks(
+                    debug_frame,
+                    hand_landmarks,
+                    self.mp_hands.HAND_CONNECTIONS,
+                    self.hand_landmarks_style,
+                    self.hand_connections_style
+                )
+        
+        # Draw key pose landmarks on the debug frame (temple and hips)
+        if pose_results.pose_landmarks:
+            pose_landmarks = pose_results.pose_landmarks.landmark
+            h, w, _ = debug_frame.shape
+            
+            for index, label, outer_color, inner_color in self.pose_markers:
+                # Convert normalized coordinates to pixel coordinates
+                landmark = pose_landmarks[index]
+                x = int(landmark.x * w)
+                y = int(landmark.y * h)
+                
+                # Two-tone circle at the key point, with its label next to it
+                cv2.circle(debug_frame, (x, y), 8, outer_color, -1)
+                cv2.circle(debug_frame, (x, y), 4, inner_color, -1)
+                cv2.putText(debug_frame, label, (x + 10, y), cv2.FONT_HERSHEY_SIMPLEX, 0.5, outer_color, 1)
@@ -1,7 +1,13 @@
 """
 Main application file for the Photo Gallery App with Gesture Recognition
 """
+import os
 import sys
+
+# MediaPipe's native logging reads this when it is first imported (through components.app):
+# keep it down to errors
+os.environ.setdefault("GLOG_minloglevel", "2")
+
 from PyQt5.QtWidgets import QApplication
 from components.app import PhotoGalleryApp
 